@@ -1,7 +1,374 @@
 import os
+import re
+import codecs
+import shutil
 import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, NamedTuple, Optional, Tuple
 import fnmatch # 用于匹配文件名模式，例如 *.pyc
 
+# 报告中的结构行预先编码为字节模板，遍历时只需 % 填入缩进和名称；各层级缩进按深度缓存复用
+_SEPARATOR_LINE = '=' * 60
+_SKIP_DIR_LINE = "%s🚫 SKIPPING DIRECTORY: %s/\n".encode('utf-8')
+_DIR_LINE = "%s📁 %s/\n".encode('utf-8')
+_SKIP_FILE_LINE = "%s  🚫 SKIPPING FILE: %s\n".encode('utf-8')
+_FILE_HEADER = ("%s📄 %s\n%s" + _SEPARATOR_LINE + "\n").encode('utf-8')
+_FILE_TRAILER = ("%s" + _SEPARATOR_LINE + "\n\n").encode('utf-8')
+_INDENT_CACHE = [b"", b"  "]
+
+# 按扩展名视为 UTF-8 文本的文件：只抽检头部编码，其余内容由内核直接复制（os.sendfile）
+_TEXT_SAFE_SUFFIXES = ('.py', '.md', '.txt', '.rst', '.json', '.toml', '.ini', '.cfg', '.yml', '.yaml')
+_PROBE_SIZE = 8 * 1024
+
+# 头部含 NUL 字节的文件视为二进制文件，只需嗅探前 4 KiB 即可跳过，无需读取全文
+_SNIFF_SIZE = 4 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+# 不超过该大小的文件由线程池预先整体读入；更大的文件留给主线程流式复制，避免占用过多内存
+_PREFETCH_LIMIT = 256 * 1024
+_PREFETCH_WORKERS = 8
+_PREFETCH_WINDOW = _PREFETCH_WORKERS * 4
+
+
+def _indent(level):
+    while len(_INDENT_CACHE) <= level:
+        _INDENT_CACHE.append(_INDENT_CACHE[-1] + b"  ")
+    return _INDENT_CACHE[level]
+
+
+class _FileSpan(NamedTuple):
+    """
+    待由内核直接复制到报告中的文件区段。
+    """
+    file: object                   # 已打开的二进制源文件
+    offset: int                    # 复制起始偏移
+    count: int                     # 复制字节数
+
+
+def _write_file_span(outfile, span):
+    """
+    将文件区段写入报告：优先使用 os.sendfile 在内核中复制，平台不支持时回退到缓冲复制。
+    """
+    outfile.flush() # 先写出缓冲区中已有的内容，保证输出顺序
+    out_fd = outfile.fileno()
+    in_fd = span.file.fileno()
+    offset = span.offset
+    end = span.offset + span.count
+    try:
+        while offset < end:
+            sent = os.sendfile(out_fd, in_fd, offset, end - offset)
+            if sent == 0: # 文件在扫描期间被截断
+                break
+            offset += sent
+    except OSError:
+        # 部分平台（如 macOS）只允许向 socket 执行 sendfile，回退到缓冲复制
+        span.file.seek(offset)
+        shutil.copyfileobj(span.file, outfile, 64 * 1024)
+
+
+class _ExcludeSpec(NamedTuple):
+    """
+    预处理后的排除规则，按判断代价从低到高排列。
+    """
+    basenames: frozenset           # 精确匹配的文件/目录名
+    relpaths: frozenset            # 精确匹配的相对路径（含 '/'）
+    suffixes: Tuple[str, ...]      # '*.ext' 形式的模式，转换为后缀元组
+    regex: Optional[re.Pattern]    # 其余通配符模式合并后的正则，无则为 None
+    excluded: Callable[[str, str], bool] # 按上述规则特化生成的判断函数 excluded(name, rel_prefix)
+
+
+def _build_exclude_predicate(basenames, relpaths, suffixes, regex):
+    """
+    生成专用的排除判断函数 excluded(name, rel_prefix)。
+
+    只为非空的规则生成判断分支，常见的简单排除列表不会执行多余的检查。
+    生成的源码只包含固定的表达式片段，排除项本身通过命名空间传入，不会拼接进代码。
+    """
+    terms = []
+    if basenames:
+        terms.append("name in BASENAMES")
+    if relpaths:
+        terms.append("rel_prefix + name in RELPATHS")
+    if suffixes:
+        terms.append("name.endswith(SUFFIXES)")
+    if regex is not None:
+        terms.append("REGEX_MATCH(name) is not None")
+    source = "def excluded(name, rel_prefix):\n    return " + (" or ".join(terms) or "False") + "\n"
+    namespace = {
+        'BASENAMES': basenames,
+        'RELPATHS': relpaths,
+        'SUFFIXES': suffixes,
+        'REGEX_MATCH': regex.match if regex is not None else None,
+    }
+    exec(source, namespace)
+    return namespace['excluded']
+
+
+@lru_cache(maxsize=None)
+def _compile_glob(pattern):
+    """
+    翻译并编译单个通配符模式；独立于 fnmatch 的全局缓存，不会被其他调用挤出。
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+@lru_cache(maxsize=32)
+def _compile_excludes(items):
+    """
+    对排除项分类并编译，结果按排除项元组缓存。
+
+    精确名称、相对路径用 frozenset 做 O(1) 查找；'*.ext' 形式的模式合并为后缀元组，
+    一次 str.endswith 即可判断；其余通配符模式一次性翻译并合并成单个正则。
+
+    Args:
+        items (tuple): 已标准化的排除项元组（需可哈希）。
+
+    Returns:
+        _ExcludeSpec: 分类后的排除规则。
+    """
+    glob_chars = '*?['
+    basenames = []
+    relpaths = []
+    suffixes = []
+    glob_patterns = []
+    for item in items:
+        if item.startswith('*') and not any(ch in item[1:] for ch in glob_chars):
+            suffixes.append(item[1:])
+        elif any(ch in item for ch in glob_chars):
+            glob_patterns.append(item)
+        elif '/' in item:
+            relpaths.append(item)
+        else:
+            basenames.append(item)
+    regex = None
+    if len(glob_patterns) == 1:
+        regex = _compile_glob(glob_patterns[0])
+    elif glob_patterns: # 空正则会匹配任何名称，必须跳过
+        regex = re.compile("|".join(_compile_glob(p).pattern for p in glob_patterns))
+    basenames = frozenset(basenames)
+    relpaths = frozenset(relpaths)
+    suffixes = tuple(suffixes)
+    return _ExcludeSpec(basenames, relpaths, suffixes, regex,
+                        _build_exclude_predicate(basenames, relpaths, suffixes, regex))
+
+
+def _iter_file_body(path, filename, use_sendfile=False):
+    """
+    逐块产出单个文件在报告中的内容部分（不含文件标题和分隔线）。
+
+    Args:
+        path (str): 文件路径。
+        filename (str): 文件名，用于提示信息。
+        use_sendfile (bool): 为 True 时，文本类文件只抽检头部编码，剩余内容以
+                             _FileSpan 产出，由调用方通过 os.sendfile 复制。
+
+    Yields:
+        bytes | _FileSpan: 文件内容片段；无法读取时产出相应的提示信息。
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    last_byte = b'' # 最后产出的内容字节
+    emitted = 0 # 已产出的内容字节数
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(_SNIFF_SIZE)
+            if b'\x00' in head:
+                yield f"[WARNING] '{filename}' appears to be a binary file. Content skipped.\n".encode('utf-8')
+                return
+
+            if use_sendfile and filename.endswith(_TEXT_SAFE_SUFFIXES):
+                # 文本类文件：抽检头部编码后，剩余内容交给内核复制
+                size = os.fstat(f.fileno()).st_size
+                head += f.read(_PROBE_SIZE - len(head))
+                decoder.decode(head, final=len(head) >= size)
+                final_byte = head[-1:]
+                if size > len(head):
+                    f.seek(size - 1)
+                    final_byte = f.read(1)
+                if head:
+                    yield head
+                    last_byte = head[-1:]
+                    emitted = len(head)
+                if size > len(head):
+                    yield _FileSpan(f, len(head), size - len(head))
+                    last_byte = final_byte
+            else:
+                # 以 64 KiB 分块流式产出文件内容，内存占用与文件大小无关
+                chunk = head
+                while chunk:
+                    decoder.decode(chunk) # 非 UTF-8 内容抛出 UnicodeDecodeError
+                    yield chunk
+                    last_byte = chunk[-1:]
+                    emitted += len(chunk)
+                    chunk = f.read(_CHUNK_SIZE)
+                decoder.decode(b'', final=True) # 检查文件末尾是否有截断的多字节字符
+        if last_byte != b'\n': # 确保文件内容后有一个换行符
+            yield b'\n'
+    except UnicodeDecodeError:
+        if not emitted:
+            yield f"[WARNING] Could not decode '{filename}' as UTF-8. It might be a binary file or have a different encoding. Content skipped.\n".encode('utf-8')
+            return
+        # 流式输出时解码失败前已产出部分内容：明确提示内容被截断
+        if last_byte != b'\n':
+            yield b'\n'
+        yield (f"[WARNING] Could not decode '{filename}' as UTF-8 after the first {emitted} bytes. "
+               f"It might be a binary file or have a different encoding. Content above is truncated.\n").encode('utf-8')
+    except Exception as e:
+        yield f"[ERROR] Could not read '{filename}': {e}. Content skipped.\n".encode('utf-8')
+
+
+def _read_small_file_body(path, filename):
+    """
+    整体读入小文件并返回其在报告中的内容部分。
+
+    先完整校验 UTF-8 编码再输出：解码失败时只返回提示信息，不输出任何部分内容。
+
+    Args:
+        path (str): 文件路径。
+        filename (str): 文件名，用于提示信息。
+
+    Returns:
+        bytes: 文件内容（保证以换行符结尾），或相应的提示信息。
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        if b'\x00' in data[:_SNIFF_SIZE]:
+            return f"[WARNING] '{filename}' appears to be a binary file. Content skipped.\n".encode('utf-8')
+        data.decode('utf-8') # 非 UTF-8 内容抛出 UnicodeDecodeError
+    except UnicodeDecodeError:
+        return f"[WARNING] Could not decode '{filename}' as UTF-8. It might be a binary file or have a different encoding. Content skipped.\n".encode('utf-8')
+    except Exception as e:
+        return f"[ERROR] Could not read '{filename}': {e}. Content skipped.\n".encode('utf-8')
+    if not data.endswith(b'\n'): # 确保文件内容后有一个换行符
+        data += b'\n'
+    return data
+
+
+def _prefetch_file_body(entry, use_sendfile):
+    """
+    在线程池中执行：小文件整体读入、校验后返回 bytes；大文件返回尚未开始的
+    _iter_file_body 生成器，由主线程按顺序流式复制。
+    """
+    try:
+        small = entry.stat().st_size <= _PREFETCH_LIMIT
+    except OSError:
+        small = True # 交给 _read_small_file_body 输出错误信息
+    if small:
+        return _read_small_file_body(entry.path, entry.name)
+    return _iter_file_body(entry.path, entry.name, use_sendfile)
+
+
+def _iter_prefetched_bodies(executor, entries, use_sendfile):
+    """
+    按原顺序产出各文件的内容；最多同时提交 _PREFETCH_WINDOW 个读取任务，限制内存占用。
+    """
+    pending = deque()
+    for entry in entries:
+        pending.append(executor.submit(_prefetch_file_body, entry, use_sendfile))
+        if len(pending) >= _PREFETCH_WINDOW:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _write_chunks(outfile, chunks):
+    """
+    将内容片段写入报告，_FileSpan 交给内核直接复制。
+    """
+    for chunk in chunks:
+        if chunk.__class__ is _FileSpan:
+            _write_file_span(outfile, chunk)
+        else:
+            outfile.write(chunk)
+
+
+def _iter_scan_chunks(project_root_dir, spec):
+    """
+    遍历项目目录，按输出顺序产出报告中的目录结构（UTF-8 字节串）和待输出内容的文件。
+
+    Args:
+        project_root_dir (str): 已规范化的项目根目录绝对路径。
+        spec (_ExcludeSpec): 预处理后的排除规则。
+
+    Yields:
+        bytes | os.DirEntry: 结构片段，或需要在该位置写入内容的文件。
+    """
+    excluded = spec.excluded
+
+    # 使用 os.scandir 显式栈遍历目录树（深度优先，访问顺序与 os.walk topdown 一致），
+    # 复用 DirEntry 缓存的类型信息和路径，避免逐项 stat 和 os.path.join
+    # 栈帧为 (目录路径, 相对路径, 深度)，根目录深度为 0
+    stack = deque([(project_root_dir, "", 0)])
+    while stack:
+        # relative_dirpath: 相对于项目根目录、以 '/' 分隔的路径，根目录为空串
+        dirpath, relative_dirpath, depth = stack.pop()
+
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue # 与 os.walk 一致，忽略无法读取的目录
+
+        dir_entries = []
+        file_entries = []
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dir_entries.append(entry)
+            else:
+                file_entries.append(entry)
+
+        # 计算当前目录的缩进级别：根目录及其直接子目录都不缩进
+        indent_level = depth - 1 if depth else 0
+        current_indent = _indent(indent_level)
+
+        # 子项相对路径直接用 '/' 拼接 DirEntry 名称，无需 os.path.join 和斜杠替换
+        rel_prefix = relative_dirpath + '/' if relative_dirpath else ''
+
+        # --- 排除目录处理 ---
+        # 只有未被排除的子目录才会压入栈中继续遍历
+        subdirs = []
+        for entry in dir_entries:
+            dname = entry.name
+
+            # 默认排除所有隐藏目录，先于模式匹配判断
+            if dname[:1] == '.' or excluded(dname, rel_prefix):
+                yield _SKIP_DIR_LINE % (current_indent, dname.encode('utf-8'))
+                continue
+
+            if not entry.is_symlink(): # 与 os.walk 一致，不进入符号链接目录
+                subdirs.append((entry.path, rel_prefix + dname, depth + 1))
+
+        # --- 写入当前目录结构 ---
+        if relative_dirpath: # 根目录不作为子目录显示
+            yield _DIR_LINE % (current_indent, os.path.basename(dirpath).encode('utf-8'))
+
+        # --- 文件处理 ---
+        for entry in file_entries:
+            filename = entry.name
+
+            # 默认排除所有隐藏文件，先于模式匹配判断
+            if filename[:1] == '.' or excluded(filename, rel_prefix):
+                yield _SKIP_FILE_LINE % (current_indent, filename.encode('utf-8'))
+                continue
+
+            # 写入文件结构和内容
+            file_indent = _indent(indent_level + 1)
+            yield _FILE_HEADER % (file_indent, filename.encode('utf-8'), file_indent) # 文件名及分隔线
+
+            yield entry # 文件内容由调用方通过 _iter_file_body 读取
+
+            yield _FILE_TRAILER % file_indent
+
+        # 逆序压栈，保证子目录按读取顺序依次出栈
+        stack.extend(reversed(subdirs))
+
+
 def scan_project_to_txt(
     project_root_dir,
     output_filename="project_scan_report.txt",
@@ -36,113 +403,54 @@ def scan_project_to_txt(
         output_filename         # 确保不扫描自身输出文件
     ]
     exclude_items.extend(default_excludes)
-    # 将排除列表中的目录名标准化，以便更好地匹配
-    exclude_items = [item.rstrip(os.sep) for item in exclude_items]
+    # 将排除项标准化为 '/' 分隔且不带结尾斜杠，'uploads/' 与 'uploads' 等价，
+    # 相对路径可直接与遍历时拼接的相对路径比较
+    exclude_items = [item.replace('\\', '/').rstrip('/') for item in exclude_items]
 
+    # 预先对排除项分类并编译（按排除项缓存，重复扫描时直接复用）
+    spec = _compile_excludes(tuple(sorted(exclude_items)))
 
     # 规范化根目录路径
     project_root_dir = os.path.abspath(project_root_dir)
 
-    with open(output_filename, 'w', encoding='utf-8') as outfile:
-        outfile.write(f"--- Project Scan Report: {os.path.basename(project_root_dir)} ---\n\n")
-        outfile.write(f"Scan Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-        outfile.write(f"Root Directory: {project_root_dir}\n")
-        outfile.write(f"Excluded Items (user defined + default): {exclude_items}\n\n")
-        outfile.write("-" * 80 + "\n\n")
-
-        # 使用 os.walk 遍历目录树
-        for dirpath, dirnames, filenames in os.walk(project_root_dir, topdown=True):
-            # 获取当前目录相对于项目根目录的路径
-            relative_dirpath = os.path.relpath(dirpath, project_root_dir)
-            if relative_dirpath == ".":
-                relative_dirpath = "" # 根目录本身不带前缀
-
-            # 计算当前目录的缩进级别
-            indent_level = relative_dirpath.count(os.sep) if relative_dirpath else 0
-            current_indent = "  " * indent_level
-
-            # --- 排除目录处理 ---
-            # 必须在 os.walk 的 topdown=True 模式下修改 dirnames，
-            # 这样 os.walk 就不会进入这些被移除的目录。
-            dirnames_copy = dirnames[:] # 复制一份，因为我们要在循环中修改原列表
-            for dname in dirnames_copy:
-                full_relative_path_for_dir = os.path.join(relative_dirpath, dname).replace('\\', '/') # 统一斜杠
-                
-                should_exclude_dir = False
-                for exclude_item in exclude_items:
-                    # 如果排除项是目录名（不含路径），且是当前目录的直接子目录
-                    if exclude_item == dname:
-                        should_exclude_dir = True
-                        break
-                    # 如果排除项是相对路径（如 "env/subdir"）
-                    if full_relative_path_for_dir == exclude_item:
-                         should_exclude_dir = True
-                         break
-                    # 如果排除项是完整目录路径（如 "uploads"），并且它是当前目录的直接子目录
-                    if full_relative_path_for_dir == exclude_item:
-                        should_exclude_dir = True
-                        break
-                    # 匹配以 '/' 结尾的目录，例如 'uploads/'
-                    if exclude_item.endswith('/') and full_relative_path_for_dir == exclude_item.rstrip('/'):
-                        should_exclude_dir = True
-                        break
-
-                if dname.startswith('.'): # 默认排除所有隐藏目录
-                     should_exclude_dir = True
-                     
-                if should_exclude_dir:
-                    outfile.write(f"{current_indent}🚫 SKIPPING DIRECTORY: {dname}/\n")
-                    dirnames.remove(dname) # 阻止 os.walk 进入此目录
-                    continue
-
-            # --- 写入当前目录结构 ---
-            if relative_dirpath: # 根目录不作为子目录显示
-                outfile.write(f"{current_indent}📁 {os.path.basename(dirpath)}/\n")
-
-            # --- 文件处理 ---
-            for filename in filenames:
-                full_relative_path_for_file = os.path.join(relative_dirpath, filename).replace('\\', '/') # 统一斜杠
-                
-                should_exclude_file = False
-                for exclude_item in exclude_items:
-                    # 精确匹配文件名
-                    if exclude_item == filename:
-                        should_exclude_file = True
-                        break
-                    # 精确匹配相对路径文件
-                    if full_relative_path_for_file == exclude_item:
-                        should_exclude_file = True
-                        break
-                    # 使用 fnmatch 匹配模式，如 *.pyc
-                    if fnmatch.fnmatch(filename, exclude_item):
-                        should_exclude_file = True
-                        break
-                
-                if filename.startswith('.'): # 默认排除所有隐藏文件
-                    should_exclude_file = True
-
-                if should_exclude_file:
-                    outfile.write(f"{current_indent}  🚫 SKIPPING FILE: {filename}\n")
-                    continue
-
-                # 写入文件结构和内容
-                file_indent = "  " * (indent_level + 1)
-                outfile.write(f"{file_indent}📄 {filename}\n")
-                outfile.write(f"{file_indent}{'=' * 60}\n") # 分隔线
-
-                try:
-                    filepath = os.path.join(dirpath, filename)
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        outfile.write(content)
-                        if not content.endswith('\n'): # 确保文件内容后有一个换行符
-                            outfile.write('\n')
-                except UnicodeDecodeError:
-                    outfile.write(f"[WARNING] Could not decode '{filename}' as UTF-8. It might be a binary file or have a different encoding. Content skipped.\n")
-                except Exception as e:
-                    outfile.write(f"[ERROR] Could not read '{filename}': {e}. Content skipped.\n")
-                
-                outfile.write(f"{file_indent}{'=' * 60}\n\n")
+    # 以二进制模式打开输出文件并使用 1 MiB 缓冲区，绕过 TextIOWrapper 的逐次编码和换行转换
+    with open(output_filename, 'wb', buffering=1 << 20) as outfile:
+        def write(text):
+            outfile.write(text.encode('utf-8'))
+
+        write(f"--- Project Scan Report: {os.path.basename(project_root_dir)} ---\n\n")
+        write(f"Scan Date: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        write(f"Root Directory: {project_root_dir}\n")
+        write(f"Excluded Items (user defined + default): {exclude_items}\n\n")
+        write("-" * 80 + "\n\n")
+
+        # 第一阶段：单线程遍历目录，按顺序收集结构片段和待输出的文件
+        items = list(_iter_scan_chunks(project_root_dir, spec))
+        file_entries = [item for item in items if item.__class__ is not bytes]
+
+        # 第二阶段：线程池并行读取文件内容（I/O 期间释放 GIL），主线程按原顺序写出。
+        # 结构行和小文件内容先累积到 bytearray，满 64 KiB 才写一次，减少 write 调用
+        use_sendfile = hasattr(os, 'sendfile') # Windows 不提供 os.sendfile
+        buf = bytearray()
+        with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as executor:
+            bodies = _iter_prefetched_bodies(executor, file_entries, use_sendfile)
+            for item in items:
+                if item.__class__ is bytes:
+                    buf += item
+                else:
+                    body = next(bodies)
+                    if body.__class__ is bytes:
+                        buf += body
+                    else:
+                        # 大文件：先写出已累积的内容，再流式复制
+                        outfile.write(buf)
+                        buf.clear()
+                        _write_chunks(outfile, body)
+                        continue
+                if len(buf) >= _CHUNK_SIZE:
+                    outfile.write(buf)
+                    buf.clear()
+        outfile.write(buf)
 
     print(f"\nScan complete! Report saved to '{output_filename}'")
     print(f"Project root scanned: '{project_root_dir}'")
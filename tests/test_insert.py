@@ -1,35 +1,26 @@
-import os
 import json
+import math
 import pytest
-import tempfile
 from tinydb import TinyDB
 from tinydb_tool.commands.insert_cmd import execute_insert_command
 
 class TestInsertCommand:
     
     @pytest.fixture
-    def temp_files(self):
+    def temp_files(self, tmp_path):
         """
         Fixture: Creates a temporary database file and a temporary input data file.
         Returns a tuple of (db_path, input_json_path).
         """
-        # Create temp DB file path (closed immediately, just need the name)
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            db_path = f.name
+        # Temp DB file path (TinyDB creates the file on first use)
+        db_path = str(tmp_path / "db.json")
             
         # Create temp input JSON file for --file-input testing
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            input_json_path = f.name
-            # Write sample data to input file
-            json.dump([{"source": "file", "id": 1}, {"source": "file", "id": 2}], f)
+        input_json_path = tmp_path / "input.json"
+        # Write sample data to input file
+        input_json_path.write_text(json.dumps([{"source": "file", "id": 1}, {"source": "file", "id": 2}]))
 
-        yield db_path, input_json_path
-
-        # Cleanup
-        if os.path.exists(db_path):
-            os.remove(db_path)
-        if os.path.exists(input_json_path):
-            os.remove(input_json_path)
+        return db_path, str(input_json_path)
 
     def test_insert_single_document(self, temp_files):
         """Test inserting a single JSON object via --data string."""
@@ -91,4 +82,19 @@ class TestInsertCommand:
         # Should catch error and return 1
         result = execute_insert_command(db_path=db_path, data=invalid_data)
         
-        assert result == 1
\ No newline at end of file
+        assert result == 1
+
+    def test_insert_non_finite_numbers_round_trip(self, temp_files):
+        """Test that NaN and Infinity are stored as such, not as null."""
+        db_path, _ = temp_files
+        
+        result = execute_insert_command(db_path=db_path, data='{"x": NaN, "y": -Infinity, "z": null}')
+        
+        assert result == 0
+        with open(db_path) as f:
+            assert f.read() == '{"_default": {"1": {"x": NaN, "y": -Infinity, "z": null}}}'
+        
+        db = TinyDB(db_path)
+        doc = db.all()[0]
+        assert math.isnan(doc['x']) and doc['y'] == -math.inf and doc['z'] is None
+        db.close()
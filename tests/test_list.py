@@ -1,22 +1,25 @@
-import os
+import io
+import json
+
 import pytest
-import tempfile
 from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage
 from tinydb_tool.commands.list_cmd import execute_list_command
+from tinydb_tool.shared.formatting import format_documents, stream_documents
 
 
 class TestListCommand:
     @pytest.fixture
-    def temp_db_with_data(self):
+    def temp_db_with_data(self, tmp_path):
         """
         Fixture: Creates a database file with temporary data.
         """
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            db_path = f.name
+        # Database file inside pytest's per-test temporary directory
+        db_path = str(tmp_path / "db.json")
         
-        # Initialize data
-        db = TinyDB(db_path)
+        # Initialize data (buffered in memory, written once on close())
+        db = TinyDB(db_path, storage=CachingMiddleware(JSONStorage))
         sample_docs = [
             {'name': 'Alice', 'age': 30, 'city': 'New York'},
             {'name': 'Bob', 'age': 25, 'city': 'Los Angeles'},
@@ -25,11 +28,7 @@ class TestListCommand:
         db.insert_multiple(sample_docs)
         db.close()
         
-        yield db_path, sample_docs
-        
-        # Cleanup: Delete the temporary file
-        if os.path.exists(db_path):
-            os.remove(db_path)
+        return db_path, sample_docs
 
     def test_list_command_execution(self, temp_db_with_data, capsys):
         """
@@ -48,3 +47,73 @@ class TestListCommand:
         for doc in sample_data:
             assert doc['name'] in captured.out
             assert str(doc['age']) in captured.out
+
+    def test_list_missing_database(self, tmp_path, capsys):
+        """
+        Tests that listing a non-existent database reports no documents without creating it.
+        """
+        db_path = tmp_path / "missing.json"
+        
+        result_code = execute_list_command(str(db_path), pretty=False)
+        
+        assert result_code == 0
+        assert "No documents found in the database." in capsys.readouterr().out
+        assert not db_path.exists()
+
+    def test_list_pretty_output(self, tmp_path, capsys):
+        """
+        Tests that pretty output is indented by two spaces and keeps non-ASCII text as is.
+        """
+        db_path = str(tmp_path / "db.json")
+        db = TinyDB(db_path)
+        db.insert({'name': 'Zoë', 'tags': ['a']})
+        db.close()
+        
+        result_code = execute_list_command(db_path)
+        
+        assert result_code == 0
+        expected = '[\n  {\n    "name": "Zoë",\n    "tags": [\n      "a"\n    ]\n  }\n]\n'
+        assert capsys.readouterr().out == expected
+
+    def test_stream_documents_matches_formatted_output(self):
+        """
+        Tests that streaming documents one by one produces the same text as formatting them at once.
+        """
+        docs = [{'name': 'Zoë', 'nested': {'tags': ['a', {}], 'empty': []}}, {}, {'age': 2.5},
+                {'big': 1e16, 'small': [1e-07, 1e-05], 'nan': float('nan'), 'inf': -float('inf'), 'none': None}]
+        
+        for pretty in (True, False):
+            out = io.BytesIO()
+            stream_documents(docs, out, pretty=pretty)
+            assert out.getvalue().decode('utf-8') == format_documents(docs, pretty) + '\n'
+
+    @pytest.mark.parametrize("document", [
+        {'big': 1e16, 'small': 1e-07},
+        {'values': [0.00001, 2.5e-05, 1.5e300, 0.0001]},
+        {'nan': float('nan'), 'inf': float('inf'), 'none': None},
+    ])
+    def test_pretty_output_matches_json_module(self, document):
+        """
+        Tests that pretty output keeps the json module's number formatting, including non-finite floats.
+        """
+        docs = [document, {'id': '3e5f', 'k': 'x": 1e'}]
+        expected = json.dumps(docs, indent=2, ensure_ascii=False)
+        
+        assert format_documents(docs, pretty=True) == expected
+        out = io.BytesIO()
+        stream_documents(docs, out, pretty=True)
+        assert out.getvalue().decode('utf-8') == expected + '\n'
+
+    def test_list_reads_values_orjson_rejects(self, tmp_path, capsys):
+        """
+        Tests that databases written by JSONStorage list correctly when orjson cannot decode them exactly.
+        """
+        db_path = str(tmp_path / "db.json")
+        db = TinyDB(db_path)
+        db.insert({'x': float('nan'), 'y': float('-inf'), 'big': 2 ** 70})
+        db.close()
+        
+        result_code = execute_list_command(db_path, pretty=False)
+        
+        assert result_code == 0
+        assert capsys.readouterr().out == '[{"x": NaN, "y": -Infinity, "big": 1180591620717411303424}]\n'
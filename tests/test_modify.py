@@ -1,19 +1,20 @@
-import os
+import math
 import pytest
-import tempfile
 from tinydb import TinyDB, Query
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage
 from tinydb_tool.commands.update_cmd import execute_update_command
 from tinydb_tool.commands.delete_cmd import execute_delete_command
 
 class TestModifyCommands:
     
     @pytest.fixture
-    def db_path(self):
+    def db_path(self, tmp_path):
         """Fixture: Setup DB for modification tests."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            path = f.name
+        path = str(tmp_path / "db.json")
         
-        db = TinyDB(path)
+        # Buffer inserts in memory; the file is written once on close()
+        db = TinyDB(path, storage=CachingMiddleware(JSONStorage))
         db.insert_multiple([
             {'id': 1, 'status': 'active', 'score': 10},
             {'id': 2, 'status': 'inactive', 'score': 5},
@@ -21,10 +22,7 @@ class TestModifyCommands:
         ])
         db.close()
         
-        yield path
-        
-        if os.path.exists(path):
-            os.remove(path)
+        return path
 
     def test_update_command(self, db_path):
         """Test updating documents based on a query."""
@@ -68,4 +66,14 @@ class TestModifyCommands:
             string_to_query="id == 1", 
             data_string="{invalid_json}"
         )
-        assert result == 1
\ No newline at end of file
+        assert result == 1
+
+    def test_update_non_finite_numbers_round_trip(self, db_path):
+        """Test that NaN and Infinity in update data are stored as such, not as null."""
+        result = execute_update_command(db_path, string_to_query="status == 'inactive'", data_string='{"score": Infinity, "ratio": NaN}')
+        assert result == 0
+        
+        db = TinyDB(db_path)
+        updated = db.get(Query().id == 2)
+        assert updated['score'] == math.inf and math.isnan(updated['ratio'])
+        db.close()
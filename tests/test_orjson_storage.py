@@ -0,0 +1,73 @@
+import json
+import math
+
+import pytest
+from tinydb import TinyDB
+
+pytest.importorskip("orjson")
+from tinydb_tool.shared.orjson_storage import ORJSONStorage
+
+
+class TestORJSONStorage:
+
+    def test_roundtrip_is_plain_json(self, tmp_path):
+        """Test that data written through orjson reads back and stays valid JSON."""
+        path = tmp_path / "db.json"
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        db.insert_multiple([{'name': 'Zoë', 'age': 30}, {'name': 'Bob', 'tags': ['a']}])
+        db.close()
+
+        assert json.loads(path.read_bytes().decode('utf-8'))['_default']['1']['name'] == 'Zoë'
+
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        assert db.all() == [{'name': 'Zoë', 'age': 30}, {'name': 'Bob', 'tags': ['a']}]
+        db.close()
+
+    def test_wide_integers_fall_back_to_json(self, tmp_path):
+        """Test that values orjson cannot encode are still written."""
+        path = tmp_path / "db.json"
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        db.insert({'big': 2 ** 70})
+        db.close()
+
+        assert json.loads(path.read_text())['_default']['1']['big'] == 2 ** 70
+
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        assert db.all() == [{'big': 2 ** 70}]
+        db.close()
+
+    def test_negative_integers_below_int64_are_read_exactly(self, tmp_path):
+        """Test that 19-digit integers below the int64 minimum are not read as floats."""
+        path = tmp_path / "db.json"
+        db = TinyDB(str(path))
+        db.insert({'n': -9223372036854775809, 'm': -(10 ** 19 - 1)})
+        db.close()
+
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        assert db.all() == [{'n': -9223372036854775809, 'm': -(10 ** 19 - 1)}]
+        db.close()
+
+    def test_non_finite_floats_fall_back_to_json(self, tmp_path):
+        """Test that NaN and Infinity are written as such instead of null."""
+        path = tmp_path / "db.json"
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        db.insert({'x': float('nan'), 'y': float('inf'), 'z': None})
+        db.close()
+
+        assert path.read_text() == '{"_default": {"1": {"x": NaN, "y": Infinity, "z": null}}}'
+
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        doc = db.all()[0]
+        assert math.isnan(doc['x']) and doc['y'] == float('inf') and doc['z'] is None
+        db.close()
+
+    def test_reads_databases_written_by_json_storage(self, tmp_path):
+        """Test that JSON orjson rejects but JSONStorage writes is still read."""
+        path = tmp_path / "db.json"
+        db = TinyDB(str(path))
+        db.insert({'y': float('-inf'), 's': '\ud800'})
+        db.close()
+
+        db = TinyDB(str(path), storage=ORJSONStorage)
+        assert db.all() == [{'y': float('-inf'), 's': '\ud800'}]
+        db.close()
@@ -1,18 +1,20 @@
-import os
+import sys
 import pytest
-import tempfile
 from tinydb import TinyDB
-from tinydb_tool.commands.query_cmd import execute_query_command
+from tinydb.middlewares import CachingMiddleware
+from tinydb.storages import JSONStorage
+from tinydb_tool.commands import query_cmd
+from tinydb_tool.commands.query_cmd import execute_query_command, parse_and_build_query
 
 class TestQueryCommand:
     
     @pytest.fixture
-    def db_path(self):
+    def db_path(self, tmp_path):
         """Fixture: Create a temporary database with diverse sample data."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            path = f.name
+        path = str(tmp_path / "db.json")
         
-        db = TinyDB(path)
+        # Buffer inserts in memory; the file is written once on close()
+        db = TinyDB(path, storage=CachingMiddleware(JSONStorage))
         db.insert_multiple([
             {'name': 'John', 'age': 30, 'role': 'admin'},
             {'name': 'Jane', 'age': 25, 'role': 'user'},
@@ -21,10 +23,7 @@ class TestQueryCommand:
         ])
         db.close()
         
-        yield path
-        
-        if os.path.exists(path):
-            os.remove(path)
+        return path
 
     def test_query_equality(self, db_path, capsys):
         """Test simple equality query (name == 'John')."""
@@ -59,6 +58,62 @@ class TestQueryCommand:
         # Should not match Jane (25)
         assert '"name": "Jane"' not in captured.out
 
+    def test_query_fuzzy_suggestion(self, db_path, capsys):
+        """Test that --fuzzy suggests the closest record when nothing matches exactly."""
+        result = execute_query_command(db_path, string_to_query="name == 'Jon'", pretty=False, fuzzy=True)
+        assert result == 0
+        
+        captured = capsys.readouterr()
+        assert "No exact matches found." in captured.out
+        assert "Did you mean this record?" in captured.out
+        assert '"name": "John"' in captured.out
+
+    def test_fuzzy_query_reads_database_once(self, db_path, monkeypatch, capsys):
+        """Test that the fuzzy fallback reuses the documents loaded for the search."""
+        calls = []
+        read_documents = query_cmd.read_documents
+        monkeypatch.setattr(query_cmd, "read_documents", lambda path: calls.append(path) or read_documents(path))
+        
+        result = execute_query_command(db_path, string_to_query="name == 'Jon'", fuzzy=True)
+        assert result == 0
+        assert calls == [db_path]
+        assert "Did you mean this record?" in capsys.readouterr().out
+
+    def test_fuzzy_match_without_rapidfuzz(self, monkeypatch):
+        """Test the difflib fallback picks the closest value, including empty strings."""
+        monkeypatch.setitem(sys.modules, "rapidfuzz", None)  # makes the import fail
+        docs = [{'name': 'Jonathan'}, {'name': 'John'}, {'name': ''}, {'age': 1}]
+        
+        match, score = query_cmd.find_best_fuzzy_match('name', 'jon', docs)
+        assert match is docs[1]
+        assert score == pytest.approx(6 / 7)
+        
+        assert query_cmd.find_best_fuzzy_match('name', '', docs) == (docs[2], 1.0)
+
+    def test_query_missing_database(self, tmp_path, capsys):
+        """Test that querying a non-existent database finds nothing and does not create it."""
+        db_path = tmp_path / "missing.json"
+        result = execute_query_command(str(db_path), string_to_query="name == 'John'")
+        assert result == 0
+        
+        assert "No documents found in the database." in capsys.readouterr().out
+        assert not db_path.exists()
+
+    def test_filter_documents_matches_tinydb_query(self):
+        """Test that the batch filter selects the same documents as the TinyDB condition."""
+        docs = [{'age': 30}, {'age': '31'}, {'age': 'n/a'}, {'name': 'x'}, {'age': None}]
+        for query_string in ("age > 29", "age <= 30", "age == 30", "age != 30"):
+            condition, parsed = parse_and_build_query(query_string)
+            expected = [doc for doc in docs if condition(doc)]
+            assert query_cmd.filter_documents(docs, *parsed) == expected
+
+    def test_unsupported_operator_is_rejected(self):
+        """Test that operators outside the dispatch tables raise a clear error."""
+        with pytest.raises(ValueError, match="Unsupported operator: ~="):
+            query_cmd.build_tinydb_query('age', '~=', '30')
+        with pytest.raises(ValueError, match="Unsupported operator: ~="):
+            query_cmd.filter_documents([{'age': 30}], 'age', '~=', '30')
+
     def test_query_invalid_syntax(self, db_path):
         """Test error handling for invalid query syntax."""
         # Missing value
@@ -67,4 +122,26 @@ class TestQueryCommand:
         
         # Unsupported operator
         result = execute_query_command(db_path, string_to_query="age ~= 30")
-        assert result == 1
\ No newline at end of file
+        assert result == 1
+
+    def test_query_numeric_value_is_not_evaluated(self, db_path, capsys):
+        """Test that numeric operators only accept plain numbers, not expressions."""
+        result = execute_query_command(db_path, string_to_query="age > 20 + 8")
+        assert result == 1
+        
+        captured = capsys.readouterr()
+        assert "Cannot parse as numeric value" in captured.err
+
+    def test_parsed_query_is_cached(self):
+        """Test that repeated query strings reuse the already built condition."""
+        first, parsed = parse_and_build_query("age > 28")
+        assert parsed == ('age', '>', '28')
+        assert parse_and_build_query("  age > 28  ")[0] is first
+        assert parse_and_build_query("age > 29")[0] is not first
+
+    def test_query_filter_is_cached(self):
+        """Test that the query command's parse reuses the already built value test."""
+        parsed, test = query_cmd.parse_query_filter("age >= 30")
+        assert parsed == ('age', '>=', '30')
+        assert query_cmd.parse_query_filter(" age >= 30 ")[1] is test
+        assert query_cmd.filter_documents([{'age': 30}, {'age': 29}], *parsed, test=test) == [{'age': 30}]
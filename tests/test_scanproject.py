@@ -0,0 +1,112 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).resolve().parent.parent / "01scanproject.py"
+SEPARATOR = b"=" * 60
+
+
+def load_scan_module():
+    """Load 01scanproject.py, whose file name is not a valid module name."""
+    spec = importlib.util.spec_from_file_location("scanproject", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def file_block(indent, name, content):
+    """Expected report block of a dumped file."""
+    prefix = b"  " * indent
+    return (prefix + "📄 ".encode('utf-8') + name + b"\n" + prefix + SEPARATOR + b"\n"
+            + content + prefix + SEPARATOR + b"\n\n")
+
+
+class TestScanProject:
+
+    @pytest.fixture
+    def module(self):
+        return load_scan_module()
+
+    @pytest.fixture
+    def scan(self, module):
+        return module.scan_project_to_txt
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        """Fixture: Create a small project tree covering the scan rules."""
+        root = tmp_path / "project"
+        (root / "pkg" / "sub").mkdir(parents=True)
+        (root / ".hiddendir").mkdir()
+        (root / "d.log").mkdir()
+
+        (root / "top.txt").write_bytes(b"hello\r\nworld")
+        (root / ".hidden.txt").write_bytes(b"excluded hidden content\n")
+        (root / ".hiddendir" / "inner.txt").write_bytes(b"excluded inner content\n")
+        (root / "d.log" / "inside.txt").write_bytes(b"excluded inside content\n")
+        (root / "app.log").write_bytes(b"excluded log content\n")
+        (root / "secret.txt").write_bytes(b"excluded secret content\n")
+        (root / "pkg" / "a.py").write_bytes(b"print(1)\n")
+        (root / "pkg" / "bin.dat").write_bytes(b"ab\x00cd")
+        (root / "pkg" / "bad.txt").write_bytes(b"ok\n\xff")
+        (root / "pkg" / "sub" / "deep.txt").write_bytes(b"deep\n")
+        (root / "pkg" / "sub" / "skip.txt").write_bytes(b"excluded skip content\n")
+        return root
+
+    def run_scan(self, scan, root, tmp_path, exclude_items=None):
+        output = tmp_path / "report.txt"
+        scan(str(root), str(output), exclude_items)
+        return output.read_bytes()
+
+    def test_structure_and_excludes(self, scan, project, tmp_path):
+        """Test indentation by depth, hidden entries and basename/relpath/suffix excludes."""
+        report = self.run_scan(scan, project, tmp_path, ['secret.txt', 'pkg/sub/skip.txt'])
+
+        # Root entries are not indented, nested directories are indented by depth
+        assert "🚫 SKIPPING DIRECTORY: .hiddendir/\n".encode('utf-8') in report
+        assert "🚫 SKIPPING DIRECTORY: d.log/\n".encode('utf-8') in report  # glob matches directories
+        assert "\n📁 pkg/\n".encode('utf-8') in report
+        assert "\n  📁 sub/\n".encode('utf-8') in report
+
+        assert "  🚫 SKIPPING FILE: .hidden.txt\n".encode('utf-8') in report
+        assert "  🚫 SKIPPING FILE: app.log\n".encode('utf-8') in report
+        assert "  🚫 SKIPPING FILE: secret.txt\n".encode('utf-8') in report
+        assert "    🚫 SKIPPING FILE: skip.txt\n".encode('utf-8') in report
+        for content in (b"excluded hidden content\n", b"excluded inner content\n", b"excluded inside content\n", b"excluded log content\n", b"excluded secret content\n", b"excluded skip content\n"):
+            assert content not in report
+
+        # Contents are copied verbatim (CRLF kept) and end with a newline
+        assert file_block(1, b"top.txt", b"hello\r\nworld\n") in report
+        assert file_block(1, b"a.py", b"print(1)\n") in report
+        assert file_block(2, b"deep.txt", b"deep\n") in report
+
+    def test_binary_and_undecodable_files_are_skipped(self, scan, project, tmp_path):
+        """Test that NUL-containing and non-UTF-8 files only produce a warning."""
+        report = self.run_scan(scan, project, tmp_path)
+
+        assert file_block(1, b"bin.dat", b"[WARNING] 'bin.dat' appears to be a binary file. Content skipped.\n") in report
+        assert file_block(1, b"bad.txt", b"[WARNING] Could not decode 'bad.txt' as UTF-8. It might be a binary "
+                                         b"file or have a different encoding. Content skipped.\n") in report
+
+    def test_large_files(self, module, scan, tmp_path):
+        """Test files above the prefetch limit: copied via sendfile, or streamed until a decode error."""
+        root = tmp_path / "project"
+        root.mkdir()
+        big = b"line of text\n" * 30000  # ~380 KiB
+        (root / "big.txt").write_bytes(big)
+        (root / "big.dat").write_bytes(big + b"\xff")
+        (root / "big.py").write_bytes(big + b"\xff")
+
+        report = self.run_scan(scan, root, tmp_path)
+
+        assert file_block(1, b"big.txt", big) in report
+        # Text-type files on the sendfile path are only validated on their first 8 KiB
+        assert file_block(1, b"big.py", big + b"\xff\n") in report
+        # Content is streamed as the sniffed head followed by fixed-size chunks; everything
+        # before the chunk holding the undecodable last byte is kept and marked as truncated
+        full_chunks = (len(big) - module._SNIFF_SIZE) // module._CHUNK_SIZE
+        streamed = module._SNIFF_SIZE + full_chunks * module._CHUNK_SIZE
+        assert big[streamed - 1:streamed] != b"\n"
+        assert file_block(1, b"big.dat", big[:streamed] + b"\n" + (
+            f"[WARNING] Could not decode 'big.dat' as UTF-8 after the first {streamed} bytes. It might be a "
+            f"binary file or have a different encoding. Content above is truncated.\n").encode('utf-8')) in report
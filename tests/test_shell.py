@@ -0,0 +1,53 @@
+import json
+
+import pytest
+from tinydb_tool.commands.shell_cmd import execute_shell_command
+
+
+class TestShellCommand:
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Fixture: Path of a not yet existing database file."""
+        return tmp_path / "db.json"
+
+    def test_shell_runs_commands_in_one_session(self, db_path, capsys):
+        """Test that writes and reads in a session see each other and are saved at the end."""
+        lines = [
+            "insert --data '[{\"name\": \"John\", \"age\": 30}, {\"name\": \"Jane\", \"age\": 25}]'",
+            "# comment lines and blank lines are skipped",
+            "",
+            "update --where \"name == 'Jane'\" --data '{\"age\": 40}'",
+            "delete --where \"name == 'John'\"",
+            "query --where 'age > 35' --no-pretty",
+        ]
+        result = execute_shell_command(str(db_path), lines)
+        assert result == 0
+        
+        assert '"name": "Jane", "age": 40' in capsys.readouterr().out
+        stored = json.loads(db_path.read_text())
+        assert list(stored['_default'].values()) == [{'name': 'Jane', 'age': 40}]
+
+    def test_shell_reports_failed_commands(self, db_path, capsys):
+        """Test that invalid lines are reported without stopping the session."""
+        lines = [
+            "query --where 'age >'",
+            "shell",
+            "insert --data '{\"name\": \"John\"}'",
+        ]
+        result = execute_shell_command(str(db_path), lines)
+        assert result == 1
+        
+        captured = capsys.readouterr()
+        assert "Invalid query format" in captured.err
+        assert "Nested shell sessions are not supported" in captured.err
+        assert json.loads(db_path.read_text())['_default'] == {'1': {'name': 'John'}}
+
+    def test_shell_reports_unreadable_database(self, db_path, capsys):
+        """Test that read commands report a corrupt database instead of failing silently."""
+        db_path.write_text('{bad')
+        
+        result = execute_shell_command(str(db_path), ["list", "query --where 'age > 35'"])
+        assert result == 1
+        
+        assert capsys.readouterr().err.count("Failed to load database from") == 2
@@ -197,6 +197,24 @@ def create_parser() -> argparse.ArgumentParser:
              'Example: \'{"status": "inactive", "updated_at": "2024-01-01"}\''
     )
     
+    # Add 'shell' subcommand
+    shell_parser = subparsers.add_parser(
+        'shell',
+        help='Run commands read from standard input against one database session',
+        description='Read commands from standard input, one per line, and run them against the '
+                   'specified database, which is opened only once. Each line uses the usual command '
+                   'syntax without --file (e.g. query --where \'age > 25\'). Writes are flushed to '
+                   'the file once, when the session ends.'
+    )
+    
+    # Add required --file argument for shell command
+    shell_parser.add_argument(
+        '--file',
+        type=str,
+        required=True,
+        help='Path to the TinyDB JSON database file'
+    )
+    
     return parser
 
 
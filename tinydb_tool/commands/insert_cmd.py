@@ -1,15 +1,27 @@
 import json
 from typing import Optional, Dict, List, Any, Union
+from tinydb import TinyDB
 from tinydb_tool.shared.db_utils import load_database
 from tinydb_tool.shared.error import handle_error
 
+try:
+    # Optional faster JSON decoder for insert payloads
+    from tinydb_tool.shared.orjson_storage import orjson_loads
+except ImportError:
+    orjson_loads = None
 
-def validate_json_data(json_str: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+
+def validate_json_data(json_str: Union[str, bytes]) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
     """
     Validate and parse JSON string.
     
+    The payload is decoded with orjson when it is installed. Input orjson rejects
+    (non-UTF-8 bytes, NaN/Infinity literals or malformed JSON) is handed to the json
+    module, which decides whether it is valid and produces the error message.
+    
     Args:
-        json_str: JSON string to validate and parse.
+        json_str: JSON text to validate and parse, either as a string or as raw
+                  UTF-8/16/32 encoded bytes (e.g. straight from a file).
         
     Returns:
         Parsed JSON data (dict or list of dicts).
@@ -19,7 +31,11 @@ def validate_json_data(json_str: str) -> Union[Dict[str, Any], List[Dict[str, An
         json.JSONDecodeError: If JSON string cannot be parsed.
     """
     try:
-        data = json.loads(json_str)
+        if orjson_loads is not None:
+            # Falls back to json for input orjson rejects, such as NaN and Infinity
+            data = orjson_loads(json_str)
+        else:
+            data = json.loads(json_str)
         
         if not isinstance(data, (dict, list)):
             raise ValueError("JSON data must be either an object (dict) or an array of objects")
@@ -39,15 +55,18 @@ def validate_json_data(json_str: str) -> Union[Dict[str, Any], List[Dict[str, An
         raise
 
 
-def read_json_from_file(file_path: str) -> str:
+def read_json_from_file(file_path: str) -> bytes:
     """
     Read JSON content from a file.
     
+    The content is returned as raw bytes so it is decoded only once, by the JSON
+    parser itself; surrounding whitespace is handled by the parser as well.
+    
     Args:
         file_path: Path to the JSON file.
         
     Returns:
-        JSON string content from the file.
+        Raw JSON content from the file.
         
     Raises:
         FileNotFoundError: If the file does not exist.
@@ -55,9 +74,8 @@ def read_json_from_file(file_path: str) -> str:
         IOError: If there's an error reading the file.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read().strip()
-        return content
+        with open(file_path, 'rb') as f:
+            return f.read()
         
     except FileNotFoundError:
         raise FileNotFoundError(f"File not found: {file_path}")
@@ -67,7 +85,8 @@ def read_json_from_file(file_path: str) -> str:
         raise IOError(f"Error reading file '{file_path}': {str(e)}")
 
 
-def execute_insert_command(db_path: str, data: Optional[str] = None, file_input: Optional[str] = None) -> int:
+def execute_insert_command(db_path: str, data: Optional[str] = None, file_input: Optional[str] = None,
+                           db: Optional[TinyDB] = None) -> int:
     """
     Execute the insert command to add documents to the database.
     
@@ -75,6 +94,8 @@ def execute_insert_command(db_path: str, data: Optional[str] = None, file_input:
         db_path: Path to the TinyDB JSON database file.
         data: JSON string to insert (if provided via --data).
         file_input: Path to JSON file to read data from (if provided via --file-input).
+        db: An already open database to use instead of loading db_path (e.g. from
+            a shell session). It is left open for the caller.
         
     Returns:
         Exit code: 0 for success, 1 for error.
@@ -104,12 +125,15 @@ def execute_insert_command(db_path: str, data: Optional[str] = None, file_input:
             handle_error(f"Invalid JSON: {str(e)}")
             return 1
 
-        # Load database
-        try:
-            db = load_database(db_path)
-        except (FileNotFoundError, PermissionError, ValueError) as e:
-            # Errors are already handled in load_database
-            return 1
+        # Load database unless the caller provides an open one
+        # (writes are buffered and flushed once on close)
+        owns_db = db is None
+        if owns_db:
+            try:
+                db = load_database(db_path, cached=True)
+            except (FileNotFoundError, PermissionError, ValueError) as e:
+                # Errors are already handled in load_database
+                return 1
         
         # Insert data into database
         try:
@@ -119,10 +143,12 @@ def execute_insert_command(db_path: str, data: Optional[str] = None, file_input:
                 doc_ids = db.insert_multiple(parsed_data)
         except Exception as e:
             handle_error(f"Failed to insert data into database: {str(e)}")
-            db.close()
+            if owns_db:
+                db.close()
             return 1
 
-        db.close()
+        if owns_db:
+            db.close()
         return 0
         
     except Exception as e:
@@ -5,41 +5,41 @@ This module implements the 'list' subcommand that displays all documents
 in a TinyDB database file.
 """
 
-from tinydb_tool.shared.db_utils import load_database
-from tinydb_tool.shared.formatting import print_documents
+from typing import Optional
+from tinydb import TinyDB
+from tinydb_tool.shared.db_utils import read_documents
+from tinydb_tool.shared.error import handle_error
+from tinydb_tool.shared.formatting import stream_documents
 
 
-def execute_list_command(file_path: str, pretty: bool = True) -> int:
+def execute_list_command(file_path: str, pretty: bool = True, db: Optional[TinyDB] = None) -> int:
     """
     Execute the list command to display all documents in the database.
     
     Args:
         file_path: Path to the TinyDB JSON database file.
         pretty: If True, format output with indentation. Default is True.
+        db: An already open database to use instead of loading file_path (e.g. from
+            a shell session). It is left open for the caller.
         
     Returns:
         Exit code: 0 for success, 1 for error.
     """
     try:
-        # Load the database
-        db = load_database(file_path)
+        # Read all documents directly from the file (read-only, no TinyDB instance)
+        all_documents = db.all() if db is not None else read_documents(file_path)
         
-        # Retrieve all documents
-        all_documents = db.all()
-        
-        # Print documents in formatted way
-        print_documents(all_documents, pretty)
-        
-        # Close the database connection
-        db.close()
+        # Print documents in formatted way, one document at a time
+        stream_documents(all_documents, pretty=pretty)
         
         return 0
         
-    except (FileNotFoundError, PermissionError, ValueError) as e:
-        # Errors are already handled in load_database
+    except (FileNotFoundError, PermissionError, ValueError, OSError) as e:
+        # Errors are already handled in read_documents, but not for a passed-in db
+        if db is not None:
+            handle_error(f"Failed to load database from '{file_path}': {str(e)}")
         return 1
     except Exception as e:
-        from tinydb_tool.shared.error import handle_error
         handle_error(f"Unexpected error while listing documents: {str(e)}")
         return 1
 
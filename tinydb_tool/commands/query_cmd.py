@@ -1,12 +1,17 @@
 import re
-from difflib import SequenceMatcher
-from typing import Any, Optional, Tuple, List, Dict
-from tinydb import Query
-from tinydb_tool.shared.db_utils import load_database
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple, List, Dict
+from tinydb import Query, TinyDB
+from tinydb_tool.shared.db_utils import read_documents
 from tinydb_tool.shared.formatting import print_documents
 from tinydb_tool.shared.error import handle_error
 
 
+# Query grammar: field (==|!=|>=|<=|>|<) value, where the value is either
+# "double quoted", 'single quoted' (quotes removed) or taken as-is
+_QUERY_RE = re.compile(r'^(\w+)\s*(==|!=|>=|<=|>|<)\s*(?:"(.*)"|\'(.*)\'|(.+?))\s*$')
+
+
 def parse_query_string(string_to_query: str) -> Optional[Tuple[str, str, Any]]:
     """
     Parse a query string into its components.
@@ -19,7 +24,8 @@ def parse_query_string(string_to_query: str) -> Optional[Tuple[str, str, Any]]:
         A tuple of (field_name, operator, value) if parsing succeeds, None otherwise.
         - field_name: The field name to query
         - operator: The comparison operator ('==', '!=', '>', '<', '>=', or '<=')
-        - value: The value to compare against (string or numeric)
+        - value: The value to compare against, with surrounding quotes removed
+          (unquoted values, which may represent numbers, are returned as-is)
     """
     if not string_to_query or not isinstance(string_to_query, str):
         return None
@@ -29,45 +35,26 @@ def parse_query_string(string_to_query: str) -> Optional[Tuple[str, str, Any]]:
     if not string_to_query:
         return None
     
-    # Support ==, !=, >, <, >=, <= operators
-    pattern = r'^(\w+)\s*(==|!=|>=|<=|>|<)\s*(.+)$'
-    match = re.match(pattern, string_to_query)
+    # Support ==, !=, >, <, >=, <= operators. The compiled pattern runs in C, which
+    # measures faster than a hand-written scanner for strings this short, and it
+    # also strips the quotes of quoted values.
+    match = _QUERY_RE.match(string_to_query)
     
     if not match:
         return None
     
-    field_name = match.group(1)
-    operator = match.group(2)
-    value_string = match.group(3).strip()
-    
-    if not field_name or not operator or not value_string:
-        return None
-    
-    value = parse_value(value_string)
+    # Exactly one of the three value groups takes part in the match
+    field_name, operator, double_quoted, single_quoted, unquoted = match.groups()
+    if double_quoted is not None:
+        value = double_quoted
+    elif single_quoted is not None:
+        value = single_quoted
+    else:
+        value = unquoted
     
     return field_name, operator, value
 
 
-def parse_value(value_string: str) -> Any:
-    """
-    Parse a value string, removing quotes if present.
-    
-    Args:
-        value_string: The value string, optionally quoted with single or double quotes.
-        
-    Returns:
-        The parsed value. If the string is quoted, returns the unquoted string.
-        Otherwise, returns the string as-is (which may represent a number).
-    """
-    value_string = value_string.strip()
-    
-    if (value_string.startswith('"') and value_string.endswith('"')) or \
-       (value_string.startswith("'") and value_string.endswith("'")):
-        return value_string[1:-1]
-
-    return value_string
-
-
 def parse_numeric_value(value: Any) -> float:
     """
     Parse a value as a numeric type (int or float).
@@ -89,38 +76,119 @@ def parse_numeric_value(value: Any) -> float:
         try:
             return float(value)
         except ValueError:
-            try:
-                import math
-                safe_namespace = {
-                    'math': math,
-                    '__builtins__': {}
-                }
-                result = eval(value, safe_namespace)
-                if isinstance(result, (int, float)):
-                    return float(result)
-                else:
-                    raise ValueError("")
-            except:
-                raise ValueError(f"Cannot parse as numeric value: {value}")
+            raise ValueError(f"Cannot parse as numeric value: {value}")
     
     raise ValueError(f"Cannot parse as numeric value: {value}")
 
 
-def is_numeric_value(value: Any) -> bool:
+def _coerce_number(value: Any) -> Optional[float]:
     """
-    Check if a value can be parsed as a number.
+    Coerce a non-numeric field value with a single float() call.
     
     Args:
-        value: Value to check.
+        value: The field value.
         
     Returns:
-        True if the value can be parsed as a number, False otherwise.
+        The value as a float, or None if it cannot be coerced.
     """
     try:
-        parse_numeric_value(value)
-        return True
-    except (ValueError, TypeError):
-        return False
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# One test factory per numeric operator: each test inlines its comparison instead
+# of calling an operator function, and binds the threshold as a default argument
+# (a fast local lookup). Values that cannot be coerced to a number never match.
+
+def _make_gt_test(threshold: float) -> Callable[[Any], bool]:
+    def test(value: Any, threshold=threshold, _number_types=(int, float)) -> bool:
+        if not isinstance(value, _number_types):
+            value = _coerce_number(value)
+            if value is None:
+                return False
+        return value > threshold
+    return test
+
+
+def _make_ge_test(threshold: float) -> Callable[[Any], bool]:
+    def test(value: Any, threshold=threshold, _number_types=(int, float)) -> bool:
+        if not isinstance(value, _number_types):
+            value = _coerce_number(value)
+            if value is None:
+                return False
+        return value >= threshold
+    return test
+
+
+def _make_lt_test(threshold: float) -> Callable[[Any], bool]:
+    def test(value: Any, threshold=threshold, _number_types=(int, float)) -> bool:
+        if not isinstance(value, _number_types):
+            value = _coerce_number(value)
+            if value is None:
+                return False
+        return value < threshold
+    return test
+
+
+def _make_le_test(threshold: float) -> Callable[[Any], bool]:
+    def test(value: Any, threshold=threshold, _number_types=(int, float)) -> bool:
+        if not isinstance(value, _number_types):
+            value = _coerce_number(value)
+            if value is None:
+                return False
+        return value <= threshold
+    return test
+
+
+def _make_eq_test(expected: Any) -> Callable[[Any], bool]:
+    def test(value: Any, expected=expected) -> bool:
+        return value == expected
+    return test
+
+
+def _make_ne_test(expected: Any) -> Callable[[Any], bool]:
+    def test(value: Any, expected=expected) -> bool:
+        return value != expected
+    return test
+
+
+def _numeric_threshold(value: Any) -> float:
+    """
+    Parse the value of a numeric comparison.
+    
+    Args:
+        value: The parsed query value.
+        
+    Returns:
+        The value as a float.
+        
+    Raises:
+        ValueError: If the value is not numeric.
+    """
+    try:
+        return parse_numeric_value(value)
+    except ValueError as e:
+        raise ValueError(f"Numeric comparison operators (>, >=, <, <=) require numeric values. {str(e)}")
+
+
+# Operator dispatch tables: the per-value test used on plain dicts, and the TinyDB
+# query condition built on a Query field
+_OP_TESTS = {
+    '==': _make_eq_test,
+    '!=': _make_ne_test,
+    '>': lambda value: _make_gt_test(_numeric_threshold(value)),
+    '>=': lambda value: _make_ge_test(_numeric_threshold(value)),
+    '<': lambda value: _make_lt_test(_numeric_threshold(value)),
+    '<=': lambda value: _make_le_test(_numeric_threshold(value)),
+}
+
+# '==' and '!=' keep TinyDB's own (hashable) conditions; every other operator wraps
+# its value test from _OP_TESTS in field.test()
+_OP_BUILDERS = {
+    '==': lambda field, value: field == value,
+    '!=': lambda field, value: field != value,
+}
 
 
 def build_tinydb_query(field_name: str, operator: str, value: Any) -> Any:
@@ -139,51 +207,126 @@ def build_tinydb_query(field_name: str, operator: str, value: Any) -> Any:
         ValueError: If the operator is not supported, or if numeric operators are used
                    with non-numeric values.
     """
-    Q = Query()
-    field = Q[field_name]
+    field = Query()[field_name]
+    build = _OP_BUILDERS.get(operator)
+    if build is not None:
+        return build(field, value)
     
-    # Handle numeric comparison operators (>, >=, <, <=)
-    if operator in ('>', '>=', '<', '<='):
-        try:
-            numeric_value = parse_numeric_value(value)
-        except ValueError as e:
-            raise ValueError(f"Numeric comparison operators (>, >=, <, <=) require numeric values. {str(e)}")
+    return field.test(build_value_test(operator, value))
+
+
+def build_value_test(operator: str, value: Any) -> Callable[[Any], bool]:
+    """
+    Build the test a single field value must pass to match a parsed condition.
+    
+    Args:
+        operator: The comparison operator ('==', '!=', '>', '<', '>=', or '<=').
+        value: The value to compare against.
         
-        if operator == '>':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) > numeric_value)
-        elif operator == '>=':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) >= numeric_value)
-        elif operator == '<':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) < numeric_value)
-        elif operator == '<=':
-            return field.test(lambda x: is_numeric_value(x) and parse_numeric_value(x) <= numeric_value)
-    
-    # Handle equality operators (==, !=)
-    if operator == '==':
-        return field == value
-    elif operator == '!=':
-        return field != value
-    else:
+    Returns:
+        A function taking a field value and returning whether it matches.
+        
+    Raises:
+        ValueError: If the operator is not supported, or if numeric operators are used
+                   with non-numeric values.
+    """
+    try:
+        build_test = _OP_TESTS[operator]
+    except KeyError:
         raise ValueError(f"Unsupported operator: {operator}")
+    
+    return build_test(value)
 
 
-def parse_and_build_query(string_to_query: str) -> Any:
+def filter_documents(documents: List[Dict], field_name: str, operator: str, value: Any,
+                     test: Optional[Callable[[Any], bool]] = None) -> List[Dict]:
+    """
+    Select the documents matching a parsed condition in a single pass.
+    
+    This is the read-only counterpart of build_tinydb_query(): it applies the same
+    matching rules (documents lacking the field never match, numeric operators coerce
+    values with float()) directly to plain dicts, without dispatching through a
+    TinyDB Query object for every document.
+    
+    Args:
+        documents: Document dictionaries to filter.
+        field_name: The field name to compare.
+        operator: The comparison operator ('==', '!=', '>', '<', '>=', or '<=').
+        value: The value to compare against.
+        test: The value test from parse_query_filter(). Built from operator and
+              value when omitted.
+        
+    Returns:
+        The matching documents, in their original order.
+        
+    Raises:
+        ValueError: If the operator is not supported, or if numeric operators are used
+                   with non-numeric values.
+    """
+    if test is None:
+        test = build_value_test(operator, value)
+    
+    return [doc for doc in documents if field_name in doc and test(doc[field_name])]
+
+
+def parse_and_build_query(string_to_query: str) -> Tuple[Any, Tuple[str, str, Any]]:
     """
     Parse a query string and build a TinyDB query condition.
     
     This function is designed to be reused by other commands (e.g., delete, update).
+    The parsed components are returned alongside the condition so callers never
+    need to parse the same string a second time.
     
     Args:
         string_to_query: Query string in the format "field == value", "field != value",
                         "field > value", "field < value", "field >= value", or "field <= value"
         
     Returns:
-        TinyDB query condition object.
+        A tuple of (query_condition, (field_name, operator, value)), where
+        query_condition is the TinyDB query condition object and the inner tuple is
+        the result of parse_query_string().
         
     Raises:
         ValueError: If the query string is invalid, empty, or operator is unsupported.
                     The error message will provide details about what went wrong.
     """
+    return _build_query_cached(_strip_query_string(string_to_query))
+
+
+def parse_query_filter(string_to_query: str) -> Tuple[Tuple[str, str, Any], Callable[[Any], bool]]:
+    """
+    Parse a query string and build the value test used by filter_documents().
+    
+    This is the read-only counterpart of parse_and_build_query(): no TinyDB query
+    condition is built. Results are cached by query string in the same way.
+    
+    Args:
+        string_to_query: Query string in the same format as for parse_and_build_query().
+        
+    Returns:
+        A tuple of ((field_name, operator, value), test), where the inner tuple is the
+        result of parse_query_string() and test is the per-value test.
+        
+    Raises:
+        ValueError: If the query string is invalid, empty, or operator is unsupported,
+                    or if numeric operators are used with non-numeric values.
+    """
+    return _parse_filter_cached(_strip_query_string(string_to_query))
+
+
+def _strip_query_string(string_to_query: str) -> str:
+    """
+    Validate that a query string is not empty and strip surrounding whitespace.
+    
+    Args:
+        string_to_query: Raw query string.
+        
+    Returns:
+        The stripped query string.
+        
+    Raises:
+        ValueError: If the query string is empty, whitespace only or not a string.
+    """
     if not string_to_query or not isinstance(string_to_query, str):
         raise ValueError("Query string cannot be empty or non-string")
     
@@ -191,6 +334,22 @@ def parse_and_build_query(string_to_query: str) -> Any:
     if not string_to_query:
         raise ValueError("Query string cannot be empty or whitespace only")
     
+    return string_to_query
+
+
+def _parse_valid_query(string_to_query: str) -> Tuple[str, str, Any]:
+    """
+    Parse a stripped, non-empty query string into its components.
+    
+    Args:
+        string_to_query: Stripped query string.
+        
+    Returns:
+        A tuple of (field_name, operator, value).
+        
+    Raises:
+        ValueError: If the query string does not match the query grammar.
+    """
     parsed = parse_query_string(string_to_query)
     if parsed is None:
         raise ValueError(
@@ -199,29 +358,92 @@ def parse_and_build_query(string_to_query: str) -> Any:
             f"'field < value', 'field >= value', or 'field <= value'. "
             f"Field names must be alphanumeric (letters, numbers, underscore)."
         )
+    return parsed
+
+
+@lru_cache(maxsize=256)
+def _build_query_cached(string_to_query: str) -> Tuple[Any, Tuple[str, str, Any]]:
+    """
+    Parse a stripped, non-empty query string and build its TinyDB query condition.
     
+    Results are cached by query string, so repeated invocations with the same
+    condition (e.g. scripted delete/update/query loops) skip parsing entirely.
+    Invalid query strings raise and are therefore never cached.
+    
+    Args:
+        string_to_query: Stripped query string.
+        
+    Returns:
+        A tuple of (query_condition, (field_name, operator, value)).
+        
+    Raises:
+        ValueError: If the query string is invalid or the operator is unsupported.
+    """
+    parsed = _parse_valid_query(string_to_query)
     field_name, operator, value = parsed
-    return build_tinydb_query(field_name, operator, value)
+    return build_tinydb_query(field_name, operator, value), parsed
 
 
-def calculate_similarity(str1: str, str2: str) -> float:
-    return SequenceMatcher(None, str(str1).lower(), str(str2).lower()).ratio()
+@lru_cache(maxsize=256)
+def _parse_filter_cached(string_to_query: str) -> Tuple[Tuple[str, str, Any], Callable[[Any], bool]]:
+    """
+    Parse a stripped, non-empty query string and build its value test.
+    
+    Args:
+        string_to_query: Stripped query string.
+        
+    Returns:
+        A tuple of ((field_name, operator, value), test).
+        
+    Raises:
+        ValueError: If the query string is invalid, the operator is unsupported, or
+                    a numeric operator has a non-numeric value.
+    """
+    parsed = _parse_valid_query(string_to_query)
+    field_name, operator, value = parsed
+    return parsed, build_value_test(operator, value)
 
 
 def find_best_fuzzy_match(field_name: str, target_value: Any, all_documents: List[Dict]) -> Optional[Tuple[Dict, float]]:
     if not all_documents:
         return None
     
+    # Imported here so that commands without --fuzzy don't pay for it
+    try:
+        # Optional C-accelerated fuzzy matching; falls back to difflib when missing
+        from rapidfuzz import fuzz, process
+    except ImportError:
+        process = None
+    
+    if process is not None:
+        candidates = [doc for doc in all_documents if field_name in doc]
+        choices = [str(doc[field_name]).lower() for doc in candidates]
+        match = process.extractOne(str(target_value).lower(), choices, scorer=fuzz.ratio)
+        if match is None or match[1] <= 0:
+            return None
+        return candidates[match[2]], match[1] / 100.0
+    
+    # Imported here so that queries without --fuzzy don't pay for it
+    from difflib import SequenceMatcher
+    
     best_match = None
     best_score = 0.0
-    target_str = str(target_value)
+    target_lc = str(target_value).lower()
+    target_len = len(target_lc)
     
     for doc in all_documents:
         if field_name in doc:
-            doc_value = doc[field_name]
-            doc_value_str = str(doc_value)
+            doc_value_lc = str(doc[field_name]).lower()
+            
+            # ratio() is at most 2*min(len)/sum(len) (1.0 for two empty strings);
+            # skip candidates that cannot beat best_score
+            total_len = target_len + len(doc_value_lc)
+            upper_bound = 2.0 * min(target_len, len(doc_value_lc)) / total_len if total_len else 1.0
+            if upper_bound <= best_score:
+                continue
             
-            score = calculate_similarity(target_str, doc_value_str)
+            # autojunk=False: no popular-character heuristic on long values, like rapidfuzz
+            score = SequenceMatcher(None, target_lc, doc_value_lc, autojunk=False).ratio()
             
             if score > best_score:
                 best_score = score
@@ -234,7 +456,8 @@ def find_best_fuzzy_match(field_name: str, target_value: Any, all_documents: Lis
     return None
 
 
-def execute_query_command(file_path: str, string_to_query: str, pretty: bool = True, fuzzy: bool = False) -> int:
+def execute_query_command(file_path: str, string_to_query: str, pretty: bool = True, fuzzy: bool = False,
+                          db: Optional[TinyDB] = None) -> int:
     """
     Execute the query command to search for documents in the database.
     
@@ -243,48 +466,43 @@ def execute_query_command(file_path: str, string_to_query: str, pretty: bool = T
         string_to_query: Query condition string in the format "field == value", "field != value",
                          "field > value", "field < value", "field >= value", or "field <= value".
         pretty: If True, format output with indentation. Default is True.
+        fuzzy: If True and an '==' query has no match, suggest the most similar record.
+        db: An already open database to use instead of loading file_path (e.g. from
+            a shell session). It is left open for the caller.
         
     Returns:
         Exit code: 0 for success, 1 for error.
     """
     try:
-        # Parse and build query condition
+        # Parse the query and build the value test documents are matched with
         try:
-            query_condition = parse_and_build_query(string_to_query)
+            parsed_query, value_test = parse_query_filter(string_to_query)
         except ValueError as e:
             handle_error(str(e))
             return 1
         
-        parsed_query = parse_query_string(string_to_query)
-        
-        # Load database
+        # Read documents (read-only, no TinyDB instance needed)
         try:
-            db = load_database(file_path)
-        except (FileNotFoundError, PermissionError, ValueError) as e:
-            # Errors are already handled in load_database
+            all_documents = db.all() if db is not None else read_documents(file_path)
+        except (FileNotFoundError, PermissionError, ValueError, OSError) as e:
+            # Errors are already handled in read_documents, but not for a passed-in db
+            if db is not None:
+                handle_error(f"Failed to load database from '{file_path}': {str(e)}")
             return 1
         
         # Search for matching documents
         try:
-            matching_documents = db.search(query_condition)
+            matching_documents = filter_documents(all_documents, *parsed_query, test=value_test)
         except Exception as e:
             handle_error(f"Failed to search database: {str(e)}")
-            db.close()
             return 1
         
-        if not matching_documents and fuzzy and parsed_query is not None:
+        if not matching_documents and fuzzy:
             field_name, operator, target_value = parsed_query
             
             if operator == '==':
                 print("No exact matches found.")
                 
-                try:
-                    all_documents = db.all()
-                except Exception as e:
-                    handle_error(f"Failed to retrieve documents for fuzzy matching: {str(e)}")
-                    db.close()
-                    return 1
-                
                 fuzzy_result = find_best_fuzzy_match(field_name, target_value, all_documents)
                 
                 if fuzzy_result is not None:
@@ -298,7 +516,6 @@ def execute_query_command(file_path: str, string_to_query: str, pretty: bool = T
         else:
             print_documents(matching_documents, pretty)
         
-        db.close()
         return 0
         
     except Exception as e:
@@ -0,0 +1,80 @@
+"""
+Shell command implementation for TinyDB tool.
+
+This module implements the 'shell' subcommand that runs a batch of commands,
+read one per line, against a single open database.
+"""
+
+import shlex
+import sys
+from typing import Iterable, Optional
+from tinydb_tool.cli import create_parser
+from tinydb_tool.shared.db_utils import load_database
+from tinydb_tool.shared.error import handle_error
+
+
+def execute_shell_command(file_path: str, lines: Optional[Iterable[str]] = None) -> int:
+    """
+    Execute the shell command to run several commands in one session.
+    
+    Each line holds one command in the usual command-line syntax without --file,
+    e.g. `insert --data '{"name": "john"}'` or `query --where 'age > 25'`. Empty
+    lines and lines starting with '#' are ignored. The database is opened once
+    with write caching, so all writes of the session are flushed to the file in a
+    single rewrite when it ends; a session that only reads never writes the file.
+    
+    Args:
+        file_path: Path to the TinyDB JSON database file.
+        lines: Command lines to execute. Defaults to standard input.
+    
+    Returns:
+        Exit code: 0 if every command succeeded, 1 otherwise.
+    """
+    if lines is None:
+        lines = sys.stdin
+    
+    parser = create_parser()
+    
+    try:
+        db = load_database(file_path, cached=True)
+    except (FileNotFoundError, PermissionError, ValueError, OSError) as e:
+        # Errors are already handled in load_database
+        return 1
+    
+    # Imported here to avoid a circular import (main lazily imports this module)
+    from tinydb_tool.main import run_command
+    
+    exit_code = 0
+    try:
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            
+            try:
+                argv = shlex.split(line)
+            except ValueError as e:
+                handle_error(f"Invalid command line '{line}': {str(e)}")
+                exit_code = 1
+                continue
+            
+            if argv[0] == 'shell':
+                handle_error("Nested shell sessions are not supported")
+                exit_code = 1
+                continue
+            
+            # The session's database file always applies
+            try:
+                args = parser.parse_args(argv + ['--file', file_path])
+            except SystemExit as e:
+                # argparse already printed usage or help
+                if e.code:
+                    exit_code = 1
+                continue
+            
+            if run_command(args, db=db) != 0:
+                exit_code = 1
+    finally:
+        db.close()
+    
+    return exit_code
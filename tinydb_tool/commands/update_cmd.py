@@ -1,10 +1,13 @@
 import json
+from typing import Optional
+from tinydb import TinyDB
 from tinydb_tool.shared.db_utils import load_database
 from tinydb_tool.shared.error import handle_error
 from tinydb_tool.commands.query_cmd import parse_and_build_query
 
 
-def execute_update_command(file_path: str, string_to_query: str, data_string: str) -> int:
+def execute_update_command(file_path: str, string_to_query: str, data_string: str,
+                           db: Optional[TinyDB] = None) -> int:
     """
     Execute the update command to modify documents in the database.
     
@@ -12,6 +15,8 @@ def execute_update_command(file_path: str, string_to_query: str, data_string: st
         file_path: Path to the TinyDB JSON database file.
         string_to_query: Query condition string to match documents for update.
         data_string: JSON string containing the fields and values to update.
+        db: An already open database to use instead of loading file_path (e.g. from
+            a shell session). It is left open for the caller.
         
     Returns:
         Exit code: 0 for success, 1 for error.
@@ -19,7 +24,7 @@ def execute_update_command(file_path: str, string_to_query: str, data_string: st
     try:
         # Parse and build query condition
         try:
-            query_condition = parse_and_build_query(string_to_query)
+            query_condition, _ = parse_and_build_query(string_to_query)
         except ValueError as e:
             handle_error(str(e))
             return 1
@@ -37,22 +42,26 @@ def execute_update_command(file_path: str, string_to_query: str, data_string: st
             handle_error(f"Error parsing update data: {str(e)}")
             return 1
         
-        # Load database
-        try:
-            db = load_database(file_path)
-        except (FileNotFoundError, PermissionError, ValueError) as e:
-            # Errors are already handled in load_database
-            return 1
+        # Load database unless the caller provides an open one
+        owns_db = db is None
+        if owns_db:
+            try:
+                db = load_database(file_path)
+            except (FileNotFoundError, PermissionError, ValueError) as e:
+                # Errors are already handled in load_database
+                return 1
         
         # Update matching documents
         try:
             db.update(update_data, query_condition)
         except Exception as e:
             handle_error(f"Failed to update documents: {str(e)}")
-            db.close()
+            if owns_db:
+                db.close()
             return 1
         
-        db.close()
+        if owns_db:
+            db.close()
         return 0
         
     except Exception as e:
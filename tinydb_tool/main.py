@@ -5,15 +5,73 @@ This module provides the command-line interface entry point that parses
 arguments and dispatches to the appropriate command handlers.
 """
 
+import argparse
 import sys
+from typing import TYPE_CHECKING, Optional
 from tinydb_tool.cli import parse_args
-from tinydb_tool.commands.list_cmd import execute_list_command
-from tinydb_tool.commands.insert_cmd import execute_insert_command
-from tinydb_tool.commands.query_cmd import execute_query_command
-from tinydb_tool.commands.delete_cmd import execute_delete_command
-from tinydb_tool.commands.update_cmd import execute_update_command
 from tinydb_tool.shared.error import handle_error
 
+if TYPE_CHECKING:
+    from tinydb import TinyDB
+
+
+def run_command(args: argparse.Namespace, db: Optional["TinyDB"] = None) -> int:
+    """
+    Dispatch parsed arguments to the matching command handler.
+    
+    Args:
+        args: Parsed command-line arguments of a single command.
+        db: An already open database to run the command against (used by the shell
+            session). If None, each command opens args.file itself.
+        
+    Returns:
+        Exit code: 0 for success, 1 for error.
+    """
+    # Command modules are imported here so that each invocation only loads what
+    # the chosen command needs
+    if args.command == 'list':
+        from tinydb_tool.commands.list_cmd import execute_list_command
+        return execute_list_command(
+            file_path=args.file,
+            pretty=args.pretty,
+            db=db
+        )
+    elif args.command == 'insert':
+        from tinydb_tool.commands.insert_cmd import execute_insert_command
+        return execute_insert_command(
+            db_path=args.file,
+            data=getattr(args, 'data', None),
+            file_input=getattr(args, 'file_input', None),
+            db=db
+        )
+    elif args.command == 'query':
+        from tinydb_tool.commands.query_cmd import execute_query_command
+        return execute_query_command(
+            file_path=args.file,
+            string_to_query=args.where,
+            pretty=args.pretty,
+            fuzzy=getattr(args, 'fuzzy', False),
+            db=db
+        )
+    elif args.command == 'delete':
+        from tinydb_tool.commands.delete_cmd import execute_delete_command
+        return execute_delete_command(
+            file_path=args.file,
+            string_to_query=args.where,
+            db=db
+        )
+    elif args.command == 'update':
+        from tinydb_tool.commands.update_cmd import execute_update_command
+        return execute_update_command(
+            file_path=args.file,
+            string_to_query=args.where,
+            data_string=args.data,
+            db=db
+        )
+    else:
+        handle_error(f"Unknown command: {args.command}")
+        return 1
+
 
 def main() -> int:
     """
@@ -34,39 +92,12 @@ def main() -> int:
             parse_args(['--help'])
             return 1
         
+        if args.command == 'shell':
+            from tinydb_tool.commands.shell_cmd import execute_shell_command
+            return execute_shell_command(file_path=args.file)
+        
         # Dispatch to the appropriate command handler
-        if args.command == 'list':
-            return execute_list_command(
-                file_path=args.file,
-                pretty=args.pretty
-            )
-        elif args.command == 'insert':
-            return execute_insert_command(
-                db_path=args.file,
-                data=getattr(args, 'data', None),
-                file_input=getattr(args, 'file_input', None)
-            )
-        elif args.command == 'query':
-            return execute_query_command(
-                file_path=args.file,
-                string_to_query=args.where,
-                pretty=args.pretty,
-                fuzzy=getattr(args, 'fuzzy', False)
-            )
-        elif args.command == 'delete':
-            return execute_delete_command(
-                file_path=args.file,
-                string_to_query=args.where
-            )
-        elif args.command == 'update':
-            return execute_update_command(
-                file_path=args.file,
-                string_to_query=args.where,
-                data_string=args.data
-            )
-        else:
-            handle_error(f"Unknown command: {args.command}")
-            return 1
+        return run_command(args)
             
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully
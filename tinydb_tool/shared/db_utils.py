@@ -5,27 +5,45 @@ This module provides functions for loading and managing TinyDB database connecti
 It handles database file operations and provides a unified interface for database access.
 """
 
+import json
+import mmap
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List
 from tinydb import TinyDB
+from tinydb.middlewares import CachingMiddleware
 from tinydb.storages import JSONStorage
 from tinydb_tool.shared.error import handle_error
 
+try:
+    # Optional faster JSON codec for reading and storage
+    import orjson
+    from tinydb_tool.shared.orjson_storage import ORJSONStorage, orjson_loads
+except ImportError:
+    orjson = None
+    ORJSONStorage = orjson_loads = None
+
+# Storage class used by load_database()
+_STORAGE_CLASS = ORJSONStorage if ORJSONStorage is not None else JSONStorage
+
 if TYPE_CHECKING:
     from tinydb import TinyDB as TinyDBType
 
 
-def load_database(path: str) -> "TinyDBType":
+def load_database(path: str, cached: bool = False) -> "TinyDBType":
     """
     Load a TinyDB database from the specified file path.
     
-    This function creates a TinyDB instance using JSON storage. If the file doesn't exist,
-    TinyDB will create it automatically. The function handles common errors like file
-    permission issues and invalid file paths.
+    This function creates a TinyDB instance using JSON storage (serialized with orjson
+    when it is installed). If the file doesn't exist, TinyDB will create it
+    automatically. The function handles common errors like file permission issues
+    and invalid file paths.
     
     Args:
         path: Path to the TinyDB JSON database file. The file will be created if it
               doesn't exist.
+        cached: If True, wrap the storage in CachingMiddleware so that all writes are
+                kept in memory and flushed to the file once, on db.close(). Use this
+                for commands that perform several writes in one invocation.
         
     Returns:
         A TinyDB database instance that can be used for database operations.
@@ -44,7 +62,8 @@ def load_database(path: str) -> "TinyDBType":
     try:
         # Create TinyDB instance with JSON storage
         # TinyDB will automatically create the file if it doesn't exist
-        db = TinyDB(path, storage=JSONStorage)
+        storage = CachingMiddleware(_STORAGE_CLASS) if cached else _STORAGE_CLASS
+        db = TinyDB(path, storage=storage)
         return db
     except FileNotFoundError as e:
         # Handle case where the directory doesn't exist
@@ -61,4 +80,86 @@ def load_database(path: str) -> "TinyDBType":
     except Exception as e:
         # Catch any other unexpected errors
         handle_error(f"Unexpected error while loading database: {str(e)}")
-        raise
\ No newline at end of file
+        raise
+
+
+def _readonly_load(path: str) -> Any:
+    """
+    Parse a JSON file without going through TinyDB's storage layer.
+    
+    With orjson available the file is memory-mapped and parsed straight from the
+    mapping, avoiding a copy of the whole file into a Python bytes object. Files
+    that cannot be mapped fall back to a regular read.
+    
+    Args:
+        path: Path to the JSON file.
+        
+    Returns:
+        The decoded JSON value, or an empty dict for an empty file.
+        
+    Raises:
+        OSError: If the file cannot be opened or read.
+        ValueError: If the file does not contain valid JSON.
+    """
+    with open(path, 'rb') as f:
+        # An empty file is an empty database (TinyDB treats it the same way)
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        
+        if orjson is None:
+            return json.loads(f.read())
+        
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return orjson_loads(f.read())
+        
+        with mapping:
+            view = memoryview(mapping)
+            try:
+                return orjson_loads(view)
+            finally:
+                # The mapping cannot be closed while a buffer export is alive
+                view.release()
+
+
+def read_documents(path: str) -> List[Dict[str, Any]]:
+    """
+    Read all documents of the default table directly from a TinyDB JSON file.
+    
+    This is a read-only fast path for commands that only display data: the file is
+    parsed once (memory-mapped and decoded with orjson when available) and the raw
+    document dicts are returned
+    without constructing a TinyDB instance, table or Document wrappers. Unlike
+    load_database(), a missing database file is not created; it simply has no
+    documents.
+    
+    Args:
+        path: Path to the TinyDB JSON database file.
+        
+    Returns:
+        A list of document dictionaries in storage order.
+        
+    Raises:
+        FileNotFoundError: If the directory containing the file doesn't exist.
+        PermissionError: If the file cannot be accessed due to permission issues.
+        ValueError: If the file does not contain a valid TinyDB JSON database.
+        OSError: For other file system related errors.
+    """
+    try:
+        data = _readonly_load(path)
+        if not isinstance(data, dict):
+            raise ValueError("top-level JSON value must be an object")
+    except FileNotFoundError:
+        if os.path.isdir(os.path.dirname(os.path.abspath(path))):
+            return []
+        handle_error(f"Directory not found for database file: {path}")
+        raise
+    except PermissionError:
+        handle_error(f"Permission denied: Cannot access database file '{path}'")
+        raise
+    except (ValueError, OSError) as e:
+        handle_error(f"Failed to load database from '{path}': {str(e)}")
+        raise
+    
+    return list(data.get(TinyDB.default_table_name, {}).values())
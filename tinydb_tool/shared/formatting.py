@@ -6,7 +6,50 @@ in a user-friendly way.
 """
 
 import json
-from typing import List, Dict, Any
+import re
+import sys
+from typing import BinaryIO, List, Dict, Any, Optional
+
+try:
+    # Optional faster JSON encoder for pretty output
+    import orjson
+    from tinydb_tool.shared.orjson_storage import orjson_dumps
+except ImportError:
+    orjson = None
+    orjson_dumps = None
+
+
+NO_DOCUMENTS_MESSAGE = "No documents found in the database."
+
+# Numbers that orjson formats differently from json: exponent notation ('1e16' vs
+# '1e+16', '1e-7' vs '1e-07') and small values json writes with an exponent
+# ('0.00001' vs '1e-05'). Only values at a line start or after a key are checked
+_FLOAT_FORMAT_RE = re.compile(rb'(?m)(?:^ *|": )-?(?:[0-9.]+e|0\.0000)')
+
+
+def _dumps_pretty_bytes(data: Any) -> Optional[bytes]:
+    """
+    Encode data as indented UTF-8 JSON using orjson, if available.
+    
+    The result is byte-for-byte what json.dumps(indent=2, ensure_ascii=False)
+    produces: output orjson would format differently (NaN, Infinity and floats in
+    or near exponent notation) is rejected. Compact output is not produced here
+    because orjson cannot emit the ", " and ": " separators used by the compact
+    format.
+    
+    Args:
+        data: A list of document dictionaries from TinyDB, or a single document.
+        
+    Returns:
+        The encoded JSON, or None if orjson is unavailable or its output would
+        differ, in which case the caller should fall back to the json module.
+    """
+    if orjson is None:
+        return None
+    encoded = orjson_dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if encoded is None or _FLOAT_FORMAT_RE.search(encoded):
+        return None
+    return encoded
 
 
 def format_documents(documents: List[Dict[str, Any]], pretty: bool = True) -> str:
@@ -21,9 +64,12 @@ def format_documents(documents: List[Dict[str, Any]], pretty: bool = True) -> st
         A formatted string representation of the documents.
     """
     if not documents:
-        return "No documents found in the database."
+        return NO_DOCUMENTS_MESSAGE
     
     if pretty:
+        encoded = _dumps_pretty_bytes(documents)
+        if encoded is not None:
+            return encoded.decode('utf-8')
         return json.dumps(documents, indent=2, ensure_ascii=False)
     else:
         return json.dumps(documents, ensure_ascii=False)
@@ -33,10 +79,80 @@ def print_documents(documents: List[Dict[str, Any]], pretty: bool = True) -> Non
     """
     Print a list of documents in a formatted way.
     
+    Pretty output encoded by orjson is written to stdout's binary buffer directly,
+    skipping the decode/re-encode round trip through the text layer.
+    
     Args:
         documents: A list of document dictionaries from TinyDB.
         pretty: If True, format JSON with indentation. If False, use compact format.
     """
+    stdout_buffer = getattr(sys.stdout, 'buffer', None)
+    if documents and pretty and stdout_buffer is not None:
+        encoded = _dumps_pretty_bytes(documents)
+        if encoded is not None:
+            sys.stdout.flush()  # Keep ordering with text already printed
+            stdout_buffer.write(encoded + b'\n')
+            return
+    
     formatted_output = format_documents(documents, pretty)
     print(formatted_output)
 
+
+def _encode_document_pretty(document: Dict[str, Any]) -> bytes:
+    """
+    Encode a single document as 2-space indented UTF-8 JSON.
+    
+    Args:
+        document: A document dictionary.
+        
+    Returns:
+        The encoded document, using orjson when it is available and produces the same output.
+    """
+    encoded = _dumps_pretty_bytes(document)
+    if encoded is not None:
+        return encoded
+    return json.dumps(document, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def stream_documents(documents: List[Dict[str, Any]], out: Optional[BinaryIO] = None,
+                     pretty: bool = True) -> None:
+    """
+    Write a list of documents as a JSON array, encoding one document at a time.
+    
+    The output is identical to print_documents(), but the formatted array is never
+    held in memory as a whole, which keeps memory use flat for large databases.
+    
+    Args:
+        documents: A list of document dictionaries from TinyDB.
+        out: Binary stream to write UTF-8 output to. Defaults to the binary buffer
+             of sys.stdout; if stdout has none, print_documents() is used instead.
+        pretty: If True, format JSON with indentation. If False, use compact format.
+    """
+    if out is None:
+        out = getattr(sys.stdout, 'buffer', None)
+        if out is None:
+            print_documents(documents, pretty)
+            return
+        sys.stdout.flush()  # Keep ordering with text already printed
+    
+    if not documents:
+        out.write(NO_DOCUMENTS_MESSAGE.encode('utf-8') + b'\n')
+        return
+    
+    write = out.write
+    if pretty:
+        # Same layout as json.dumps(documents, indent=2): each document is nested one
+        # level deeper, and JSON strings never contain raw newlines
+        write(b'[\n')
+        for i, document in enumerate(documents):
+            if i:
+                write(b',\n')
+            write(b'  ' + _encode_document_pretty(document).replace(b'\n', b'\n  '))
+        write(b'\n]\n')
+    else:
+        write(b'[')
+        for i, document in enumerate(documents):
+            if i:
+                write(b', ')
+            write(json.dumps(document, ensure_ascii=False).encode('utf-8'))
+        write(b']\n')
@@ -0,0 +1,131 @@
+"""
+orjson-backed storage for TinyDB.
+
+This module provides a drop-in replacement for TinyDB's JSONStorage that uses
+orjson to decode and encode the database file. It requires the optional orjson
+package; db_utils falls back to JSONStorage when it is not installed.
+"""
+
+import io
+import json
+import os
+import re
+from typing import Any, Dict, Optional
+
+import orjson
+from tinydb.storages import JSONStorage
+
+# orjson decodes integers outside the 64-bit range as floats; those need 19+ digits
+# (e.g. -9223372036854775809, below the int64 minimum)
+_WIDE_NUMBER_RE = re.compile(rb'\d{19}')
+
+
+def orjson_loads(data: Any) -> Any:
+    """
+    Decode JSON with orjson, accepting everything the json module accepts.
+
+    Documents containing a run of 19 or more digits (which may be an integer that
+    orjson would turn into a float) are decoded with the json module instead. The
+    check is a single C-level scan and rarely triggers on real data. Documents
+    orjson rejects but json accepts, such as the NaN and Infinity literals written
+    by TinyDB's JSONStorage or lone surrogate escapes, are decoded with json too.
+
+    Args:
+        data: The JSON document as a string, bytes or another bytes-like object.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        ValueError: If the data is not valid JSON.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    if _WIDE_NUMBER_RE.search(data):
+        return json.loads(bytes(data))
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        return json.loads(bytes(data))
+
+
+def orjson_dumps(data: Any, option: Optional[int] = None) -> Optional[bytes]:
+    """
+    Encode JSON with orjson, or return None when the result would not be exact.
+
+    orjson cannot encode integers wider than 64 bits, and it writes NaN and
+    ±Infinity as null without raising. Output containing null is therefore decoded
+    again and compared with the data (both C-level operations); on a mismatch the
+    caller should fall back to the json module, which keeps those values.
+
+    Args:
+        data: The value to encode.
+        option: orjson option flags.
+
+    Returns:
+        The encoded JSON bytes, or None if orjson cannot represent the data exactly.
+    """
+    try:
+        serialized = orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        return None
+    if b'null' in serialized and orjson.loads(serialized) != data:
+        return None
+    return serialized
+
+
+class ORJSONStorage(JSONStorage):
+    """
+    Store the data in a JSON file, serialized with orjson.
+
+    The file is opened in binary mode so that orjson can read and write UTF-8
+    bytes directly, without a text encoding layer. The on-disk format stays plain
+    JSON and remains readable by JSONStorage.
+    """
+
+    def __init__(self, path: str, create_dirs: bool = False, access_mode: str = 'rb+', **kwargs):
+        """
+        Create a new instance.
+
+        Args:
+            path: Where to store the JSON data. The file is created if it doesn't
+                  exist and the access mode allows writing.
+            create_dirs: Whether to create missing parent directories.
+            access_mode: Binary mode the file is opened in ('rb' or 'rb+').
+            **kwargs: Arguments for json.dumps(), used only when orjson cannot
+                      serialize the data exactly (e.g. integers wider than 64
+                      bits, NaN or Infinity).
+        """
+        super().__init__(path, create_dirs=create_dirs, access_mode=access_mode, **kwargs)
+
+    def read(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        # Get the file size by moving the cursor to the file end
+        self._handle.seek(0, os.SEEK_END)
+        if not self._handle.tell():
+            # File is empty, so we return ``None`` so TinyDB can properly
+            # initialize the database
+            return None
+
+        self._handle.seek(0)
+        return orjson_loads(self._handle.read())
+
+    def write(self, data: Dict[str, Dict[str, Any]]) -> None:
+        # Move the cursor to the beginning of the file just in case
+        self._handle.seek(0)
+
+        serialized = orjson_dumps(data)
+        if serialized is None:
+            serialized = json.dumps(data, **self.kwargs).encode('utf-8')
+
+        try:
+            self._handle.write(serialized)
+        except io.UnsupportedOperation:
+            raise IOError('Cannot write to the database. Access mode is "{0}"'.format(self._mode))
+
+        # Ensure the file has been written
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+        # Remove data that is behind the new cursor in case the file has
+        # gotten shorter
+        self._handle.truncate()
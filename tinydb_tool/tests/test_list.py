@@ -1,6 +1,4 @@
-import os
 import pytest
-import tempfile
 from pathlib import Path
 from tinydb import TinyDB
 from io import StringIO
@@ -9,9 +7,8 @@ import sys
 
 class TestListCommand:
     @pytest.fixture
-    def temp_db_with_data(self):
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            db_path = f.name
+    def temp_db_with_data(self, tmp_path):
+        db_path = str(tmp_path / "db.json")
         
         db = TinyDB(db_path)
         sample_docs = [
@@ -22,8 +19,4 @@ class TestListCommand:
         db.insert_multiple(sample_docs)
         db.close()
         
-        yield db_path, sample_docs
-        
-        if os.path.exists(db_path):
-            os.remove(db_path)
-    
\ No newline at end of file
+        return db_path, sample_docs